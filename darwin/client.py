@@ -1,9 +1,22 @@
+import asyncio
+import functools
 import os
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterator, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from darwin.config import Config
 from darwin.dataset import RemoteDataset
@@ -13,13 +26,103 @@ from darwin.utils import is_deprecated_project_dir, is_project_dir, urljoin
 from darwin.validators import name_taken, validation_error
 
 
+# Seconds for which the headers resolved from the config are reused
+HEADERS_CACHE_TTL = 60
+# Exceptions raised for the status codes of the responses, NotFound is given the requested URL
+READ_STATUS_EXCEPTIONS = {401: Unauthorized, 404: NotFound}
+WRITE_STATUS_EXCEPTIONS = {401: Unauthorized}
+# Exceptions raised for the error codes of 429 responses
+ERROR_CODE_EXCEPTIONS = {"INSUFFICIENT_REMAINING_STORAGE": InsufficientStorage}
+# Fields of a dataset returned by the API which are needed to build a RemoteDataset
+DATASET_FIELDS = {"id", "slug", "name", "num_images"}
+# (connect, read) timeouts in seconds of the requests which do not set their own
+REQUEST_TIMEOUT = (5, 60)
+
+
+def enable_dns_cache(maxsize: int = 128):
+    """Caches the host name resolutions of the whole process, so that new connections don't wait
+    on DNS. Resolutions are kept until the process exits, which suits short-lived CLI sessions.
+    Enabled for every client when the DARWIN_DNS_CACHE environment variable is set."""
+    if hasattr(socket.getaddrinfo, "cache_info"):
+        return
+    socket.getaddrinfo = functools.lru_cache(maxsize=maxsize)(socket.getaddrinfo)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout, so that a stalled connection can't hang the client forever"""
+
+    # Attributes kept when pickled (e.g. clients sent to multiprocessing workers)
+    __attrs__ = HTTPAdapter.__attrs__ + ["timeout"]
+
+    def __init__(self, *args, timeout=REQUEST_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
 class Client:
     def __init__(self, config: Config, default_team: Optional[str] = None):
         self.config = config
         self.url = config.get("global/api_endpoint")
+        # Same joining as darwin.utils.urljoin, precomputed as it is done for every request
+        self._api_base = f"{self.url.rstrip('/')}/" if self.url else None
         self.base_url = config.get("global/base_url")
         self.default_team = default_team or config.get("global/default_team")
         self.features = {}
+        if os.getenv("DARWIN_DNS_CACHE"):
+            enable_dns_cache()
+        self._session = self._create_session()
+        # Team slug -> (expiry time, headers) of the headers built from the config
+        self._headers_by_team: Dict[Optional[str], Tuple[float, Dict[str, str]]] = {}
+        self._build_headers(self.default_team)
+        self._aiosession = None
+        self._aioloop = None
+        # Team slug -> remote datasets listed, dropped whenever the client sends a write
+        self._dataset_cache: Dict[Optional[str], List[RemoteDataset]] = {}
+        self._dataset_cache_lock = threading.Lock()
+        # Incremented by every invalidation, so a listing started before a write is not cached
+        self._dataset_cache_generation = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Thread pool shared by the operations of the client which fan out work (e.g. scanning
+        local datasets, downloading release parts). Created on first use, shut down by close()"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4), thread_name_prefix="darwin")
+        return self._pool
+
+    def close(self):
+        """Releases the thread pool and the HTTP connections of the client"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        # Clients are pickled to be sent to multiprocessing workers (see exhaust_generator).
+        # Locks, thread pools, event loops and aiohttp sessions can't be pickled: a new lock is
+        # created on the other side and the others are created again on first use
+        state = self.__dict__.copy()
+        del state["_dataset_cache_lock"]
+        state["_pool"] = None
+        state["_aiosession"] = None
+        state["_aioloop"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._dataset_cache_lock = threading.Lock()
 
     def get(
         self, endpoint: str, team: Optional[str] = None, retry: bool = False, raw: bool = False, debug: bool = False
@@ -49,16 +152,14 @@ class Client:
         Unauthorized
             Action is not authorized
         """
-        response = requests.get(urljoin(self.url, endpoint), headers=self._get_headers(team))
+        url = self._api_base + endpoint.strip("/")
+        response = self._session.get(url, headers=self._get_headers(team))
 
-        if response.status_code == 401:
-            raise Unauthorized()
-        if response.status_code == 404:
-            raise NotFound(urljoin(self.url, endpoint))
+        self._raise_for_status(response.status_code, url, READ_STATUS_EXCEPTIONS)
         if response.status_code != 200 and retry:
             if debug:
                 print(
-                    f"Client get request response ({response.json()}) with unexpected status "
+                    f"Client get request response ({self._decode_response(response)}) with unexpected status "
                     f"({response.status_code}). "
                     f"Client: ({self})"
                     f"Request: (endpoint={endpoint})"
@@ -70,6 +171,92 @@ class Client:
         else:
             return self._decode_response(response, debug)
 
+    def get_stream(self, endpoint: str, team: Optional[str] = None):
+        """Get something from the server trough HTTP without buffering the response body,
+        so that it can be consumed incrementally (e.g. with ijson)
+
+        Parameters
+        ----------
+        endpoint : str
+            Recipient of the HTTP operation
+        team : str
+            Team to authenticate the request against
+
+        Returns
+        -------
+        requests.Response
+        Streamed response, to be closed by the caller (it can be used as a context manager)
+
+        Raises
+        ------
+        NotFound
+            Resource not found
+        Unauthorized
+            Action is not authorized
+        requests.HTTPError
+            Any other unsuccessful response, whose body can't be streamed as the requested resource
+        """
+        url = self._api_base + endpoint.strip("/")
+        response = self._session.get(url, headers=self._get_headers(team), stream=True)
+
+        if not 200 <= response.status_code < 300:
+            response.close()
+            self._raise_for_status(response.status_code, url, READ_STATUS_EXCEPTIONS)
+            raise requests.HTTPError(f"Unexpected status ({response.status_code}) for {url}", response=response)
+        response.raw.decode_content = True
+        return response
+
+    async def get_async(self, endpoint: str, team: Optional[str] = None):
+        """Get something from the server trough HTTP without blocking the event loop.
+        Requires aiohttp, several calls can be awaited concurrently (e.g. with asyncio.gather)
+
+        Parameters
+        ----------
+        endpoint : str
+            Recipient of the HTTP operation
+        team : str
+            Team to authenticate the request against
+
+        Returns
+        -------
+        dict
+        Dictionary which contains the server response
+
+        Raises
+        ------
+        NotFound
+            Resource not found
+        Unauthorized
+            Action is not authorized
+        aiohttp.ClientResponseError
+            Any other unsuccessful response
+        """
+        session = self._get_aiosession()
+        url = self._api_base + endpoint.strip("/")
+        async with session.get(url, headers=self._get_headers(team)) as response:
+            self._raise_for_status(response.status, url, READ_STATUS_EXCEPTIONS)
+            response.raise_for_status()
+            content = await response.read()
+        try:
+            return json_loads(content)
+        except ValueError:
+            text = content.decode("utf-8", errors="replace")
+            return {"error": "Response is not JSON encoded", "status_code": response.status, "text": text}
+
+    async def close_async(self):
+        """Closes the session used by the async calls, if any was opened on the running event loop.
+        Called when leaving `async with client:`"""
+        if self._aiosession is not None and self._aioloop is asyncio.get_running_loop():
+            await self._aiosession.close()
+        self._aiosession = None
+        self._aioloop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close_async()
+
     def put(self, endpoint: str, payload: Dict, team: Optional[str] = None, retry: bool = False, debug: bool = False):
         """Put something on the server trough HTTP
 
@@ -89,20 +276,22 @@ class Client:
         dict
         Dictionary which contains the server response
         """
-        response = requests.put(urljoin(self.url, endpoint), json=payload, headers=self._get_headers(team))
+        url = self._api_base + endpoint.strip("/")
+        response = self._session.put(url, json=payload, headers=self._get_headers(team))
 
-        if response.status_code == 401:
-            raise Unauthorized()
+        self._invalidate_dataset_cache()
+        self._raise_for_status(response.status_code, url, WRITE_STATUS_EXCEPTIONS)
 
+        body = self._decode_response(response, debug)
         if response.status_code == 429:
-            error_code = response.json()["errors"]["code"]
-            if error_code == "INSUFFICIENT_REMAINING_STORAGE":
-                raise InsufficientStorage()
+            exception = ERROR_CODE_EXCEPTIONS.get(body.get("errors", {}).get("code"))
+            if exception is not None:
+                raise exception()
 
         if response.status_code != 200 and retry:
             if debug:
                 print(
-                    f"Client get request response ({response.json()}) with unexpected status "
+                    f"Client get request response ({body}) with unexpected status "
                     f"({response.status_code}). "
                     f"Client: ({self})"
                     f"Request: (endpoint={endpoint}, payload={payload})"
@@ -110,7 +299,7 @@ class Client:
             time.sleep(10)
             return self.put(endpoint, payload=payload, retry=False)
 
-        return self._decode_response(response, debug)
+        return body
 
     def post(
         self,
@@ -145,17 +334,19 @@ class Client:
             payload = {}
         if error_handlers is None:
             error_handlers = []
-        response = requests.post(urljoin(self.url, endpoint), json=payload, headers=self._get_headers(team))
-        if response.status_code == 401:
-            raise Unauthorized()
+        url = self._api_base + endpoint.strip("/")
+        response = self._session.post(url, json=payload, headers=self._get_headers(team))
+        self._invalidate_dataset_cache()
+        self._raise_for_status(response.status_code, url, WRITE_STATUS_EXCEPTIONS)
 
+        body = self._decode_response(response, debug)
         if response.status_code != 200:
             for error_handler in error_handlers:
-                error_handler(response.status_code, response.json())
+                error_handler(response.status_code, body)
 
             if debug:
                 print(
-                    f"Client get request response ({response.json()}) with unexpected status "
+                    f"Client get request response ({body}) with unexpected status "
                     f"({response.status_code}). "
                     f"Client: ({self})"
                     f"Request: (endpoint={endpoint}, payload={payload})"
@@ -164,7 +355,7 @@ class Client:
                 time.sleep(10)
                 return self.post(endpoint, payload=payload, retry=False)
 
-        return self._decode_response(response, debug)
+        return body
 
     def delete(
         self,
@@ -194,26 +385,28 @@ class Client:
         """
         if error_handlers is None:
             error_handlers = []
-        response = requests.delete(urljoin(self.url, endpoint), headers=self._get_headers(team))
-        if response.status_code == 401:
-            raise Unauthorized()
+        url = self._api_base + endpoint.strip("/")
+        response = self._session.delete(url, headers=self._get_headers(team))
+        self._invalidate_dataset_cache()
+        self._raise_for_status(response.status_code, url, WRITE_STATUS_EXCEPTIONS)
 
+        body = self._decode_response(response, debug)
         if response.status_code != 200:
             for error_handler in error_handlers:
-                error_handler(response.status_code, response.json())
+                error_handler(response.status_code, body)
 
             if debug:
                 print(
-                    f"Client get request response ({response.json()}) with unexpected status "
+                    f"Client get request response ({body}) with unexpected status "
                     f"({response.status_code}). "
                     f"Client: ({self})"
-                    f"Request: (endpoint={endpoint}, payload={payload})"
+                    f"Request: (endpoint={endpoint})"
                 )
             if retry:
                 time.sleep(10)
                 return self.delete(endpoint, retry=False)
 
-        return self._decode_response(response, debug)
+        return body
 
     def list_local_datasets(self, team: Optional[str] = None) -> Iterator[Path]:
         """Returns a list of all local folders which are detected as dataset.
@@ -229,9 +422,16 @@ class Client:
             team_configs = self.config.get_all_teams()
         for team_config in team_configs:
             projects_team = Path(team_config["datasets_dir"]) / team_config["slug"]
-            for project_path in projects_team.glob("*"):
-                if project_path.is_dir() and is_project_dir(project_path):
-                    yield Path(project_path)
+            try:
+                # Read the directory eagerly so its handle is released before yielding
+                with os.scandir(projects_team) as it:
+                    project_paths = [Path(entry.path) for entry in it if entry.is_dir()]
+            except FileNotFoundError:
+                continue
+            # Probing the project structure is I/O bound, do it concurrently
+            for project_path, is_project in zip(project_paths, self.pool.map(is_project_dir, project_paths)):
+                if is_project:
+                    yield project_path
 
     def list_deprecated_local_datasets(self, team: Optional[str] = None) -> Iterator[Path]:
         """Returns a list of all local folders which are detected as datasets but use a deprecated local structure
@@ -250,23 +450,54 @@ class Client:
                 yield Path(project_path)
 
     def list_remote_datasets(self, team: Optional[str] = None) -> Iterator[RemoteDataset]:
-        """Returns a list of all available datasets with the team currently authenticated against
+        """Returns a list of all available datasets with the team currently authenticated against.
+        A fully consumed listing is cached until the next write operation of the client
 
         Returns
         -------
         list[RemoteDataset]
         List of all remote datasets
         """
-        for dataset in self.get("/datasets/", team=team):
-            yield RemoteDataset(
-                name=dataset["name"],
-                slug=dataset["slug"],
-                team=team or self.default_team,
-                dataset_id=dataset["id"],
-                image_count=dataset["num_images"],
-                progress=0,
-                client=self,
-            )
+        team = team or self.default_team
+        with self._dataset_cache_lock:
+            cached = self._dataset_cache.get(team)
+            generation = self._dataset_cache_generation
+        if cached is not None:
+            yield from cached
+            return
+
+        datasets = []
+        with self.get_stream("/datasets/", team=team) as response:
+            for dataset in ijson.items(response.raw, "item"):
+                remote_dataset = self._remote_dataset_from_json(team, dataset)
+                datasets.append(remote_dataset)
+                yield remote_dataset
+        # get_stream raises on unsuccessful responses, so this is a real listing
+        self._cache_datasets(team, datasets, generation)
+
+    async def list_remote_datasets_async(self, team: Optional[str] = None) -> List[RemoteDataset]:
+        """Returns a list of all available datasets with the team currently authenticated against,
+        without blocking the event loop. Requires aiohttp. Shares the cache of list_remote_datasets
+
+        Returns
+        -------
+        list[RemoteDataset]
+        List of all remote datasets
+        """
+        team = team or self.default_team
+        with self._dataset_cache_lock:
+            cached = self._dataset_cache.get(team)
+            generation = self._dataset_cache_generation
+        if cached is not None:
+            return list(cached)
+
+        datasets = [
+            self._remote_dataset_from_json(team, dataset)
+            for dataset in await self.get_async("/datasets/", team=team)
+        ]
+        # get_async raises on unsuccessful responses, so this is a real listing
+        self._cache_datasets(team, datasets, generation)
+        return list(datasets)
 
     def get_remote_dataset(self, dataset_identifier: Union[str, DatasetIdentifier]) -> RemoteDataset:
         """Get a remote dataset based on the parameter passed. You can only choose one of the
@@ -289,32 +520,36 @@ class Client:
             dataset_identifier.team_slug = self.default_team
 
         try:
-            matching_datasets = [
-                dataset
-                for dataset in self.list_remote_datasets(team=dataset_identifier.team_slug)
-                if dataset.slug == dataset_identifier.dataset_slug
-            ]
-        except Unauthorized:
-            # There is a chance that we tried to access an open dataset
-            dataset = self.get(f"{dataset_identifier.team_slug}/{dataset_identifier.dataset_slug}")
-
-            # If there isn't a record of this team, create one.
-            if not self.config.get_team(dataset_identifier.team_slug, raise_on_invalid_team=False):
-                datasets_dir = Path.home() / ".darwin" / "datasets"
-                self.config.set_team(team=dataset_identifier.team_slug, api_key="", datasets_dir=str(datasets_dir))
-
-            return RemoteDataset(
-                name=dataset["name"],
-                slug=dataset["slug"],
-                team=dataset_identifier.team_slug,
-                dataset_id=dataset["id"],
-                image_count=dataset["num_images"],
-                progress=0,
-                client=self,
+            # Look up the dataset directly instead of scanning the whole team listing
+            dataset = self.get(
+                f"{dataset_identifier.team_slug}/{dataset_identifier.dataset_slug}", team=dataset_identifier.team_slug
             )
-        if not matching_datasets:
-            raise NotFound(dataset_identifier)
-        return matching_datasets[0]
+        except (NotFound, Unauthorized):
+            dataset = None
+
+        # Anything but a dataset (401, 403, 404, 5xx or non JSON response) falls back to the team listing,
+        # whose Unauthorized is the right error to surface for private datasets
+        if not isinstance(dataset, dict) or not DATASET_FIELDS.issubset(dataset):
+            matching_dataset = next(
+                (
+                    dataset
+                    for dataset in self.list_remote_datasets(team=dataset_identifier.team_slug)
+                    if dataset.slug == dataset_identifier.dataset_slug
+                ),
+                None,
+            )
+            if matching_dataset is None:
+                raise NotFound(dataset_identifier)
+            return matching_dataset
+
+        # There is a chance that we accessed an open dataset.
+        # If there isn't a record of this team, create one.
+        if not self.config.get_team(dataset_identifier.team_slug, raise_on_invalid_team=False):
+            datasets_dir = Path.home() / ".darwin" / "datasets"
+            self.config.set_team(team=dataset_identifier.team_slug, api_key="", datasets_dir=str(datasets_dir))
+            self._headers_by_team.clear()
+
+        return self._remote_dataset_from_json(dataset_identifier.team_slug, dataset)
 
     def create_dataset(self, name: str, team: Optional[str] = None) -> RemoteDataset:
         """Create a remote dataset
@@ -330,15 +565,7 @@ class Client:
         The created dataset
         """
         dataset = self.post("/datasets", {"name": name}, team=team, error_handlers=[name_taken, validation_error])
-        return RemoteDataset(
-            name=dataset["name"],
-            team=team or self.default_team,
-            slug=dataset["slug"],
-            dataset_id=dataset["id"],
-            image_count=dataset["num_images"],
-            progress=0,
-            client=self,
-        )
+        return self._remote_dataset_from_json(team or self.default_team, dataset)
 
     def load_feature_flags(self, team: Optional[str] = None):
         """Gets current features enabled for a team"""
@@ -380,6 +607,8 @@ class Client:
             Team to change the directory to
         """
         self.config.put(f"teams/{team or self.default_team}/datasets_dir", datasets_dir)
+        self._headers_by_team.clear()
+        self._invalidate_dataset_cache(team or self.default_team)
 
     def _get_headers(self, team: Optional[str] = None):
         """Get the headers of the API calls to the backend.
@@ -390,16 +619,38 @@ class Client:
         Returns
         -------
         dict
-        Contains the Content-Type and Authorization token
+        Contains the Authorization token, the Content-Type is set on the session
+        """
+        team = team or self.default_team
+        cached = self._headers_by_team.get(team)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return self._build_headers(team)
+
+    def _build_headers(self, team: Optional[str]):
+        """Build the headers of the API calls for a team from the config and cache them
+        for HEADERS_CACHE_TTL seconds. The same dict is returned by every call until then,
+        so it must not be mutated.
+
+        Parameters
+        ----------
+        team: str
+            Team to build the headers for
+
+        Returns
+        -------
+        dict
+        Contains the Authorization token
         """
-        header = {"Content-Type": "application/json"}
+        header = {}
         api_key = None
-        team_config = self.config.get_team(team or self.default_team, raise_on_invalid_team=False)
+        team_config = self.config.get_team(team, raise_on_invalid_team=False)
         if team_config:
             api_key = team_config.get("api_key")
 
         if api_key is not None and len(api_key) > 0:
             header["Authorization"] = f"ApiKey {api_key}"
+        self._headers_by_team[team] = (time.monotonic() + HEADERS_CACHE_TTL, header)
         return header
 
     @classmethod
@@ -460,13 +711,14 @@ class Client:
         """
         if datasets_dir is None:
             datasets_dir = Path.home() / ".darwin" / "datasets"
-        headers = {"Content-Type": "application/json", "Authorization": f"ApiKey {api_key}"}
+        headers = {"Authorization": f"ApiKey {api_key}"}
         api_url = Client.default_api_url()
-        response = requests.get(urljoin(api_url, "/users/token_info"), headers=headers)
+        with Client._create_session() as session:
+            response = session.get(urljoin(api_url, "/users/token_info"), headers=headers)
 
         if response.status_code != 200:
             raise InvalidLogin()
-        data = response.json()
+        data = cls._decode_response(response)
         team = data["selected_team"]["slug"]
 
         config = Config(path=None)
@@ -485,6 +737,90 @@ class Client:
         """Returns the default base url"""
         return os.getenv("DARWIN_BASE_URL", "https://darwin.v7labs.com")
 
+    def _remote_dataset_from_json(self, team: Optional[str], payload: Dict) -> RemoteDataset:
+        """Builds a RemoteDataset of a team from a dataset returned by the API"""
+        return RemoteDataset(
+            name=payload["name"],
+            slug=payload["slug"],
+            team=team,
+            dataset_id=payload["id"],
+            image_count=payload["num_images"],
+            progress=0,
+            client=self,
+        )
+
+    def _cache_datasets(self, team: Optional[str], datasets: List[RemoteDataset], generation: int):
+        """Caches the remote datasets listed for a team, unless the cache was invalidated since
+        the listing started (generation being the value of the counter before the request)"""
+        with self._dataset_cache_lock:
+            if self._dataset_cache_generation == generation:
+                self._dataset_cache[team] = datasets
+
+    def _invalidate_dataset_cache(self, team: Optional[str] = None):
+        """Drops the cached remote datasets of a team, or of every team if none is given.
+        Every write (put, post, delete) drops all of them, as the endpoints are not always team scoped"""
+        with self._dataset_cache_lock:
+            self._dataset_cache_generation += 1
+            if team is None:
+                self._dataset_cache.clear()
+            else:
+                self._dataset_cache.pop(team, None)
+
+    @staticmethod
+    def _raise_for_status(status_code: int, url: str, status_exceptions: Dict[int, type]):
+        """Raises the exception mapped to the status code of a response, if any
+
+        Parameters
+        ----------
+        status_code: int
+            Status code of the response
+        url: str
+            URL of the request, attached to NotFound
+        status_exceptions: dict
+            Status code -> exception class to raise
+        """
+        exception = status_exceptions.get(status_code)
+        if exception is NotFound:
+            raise NotFound(url)
+        if exception is not None:
+            raise exception()
+
+    @staticmethod
+    def _create_session():
+        """Creates the HTTP session shared by all the calls of a client, so that connections
+        are kept alive and reused instead of being re-established for every request
+
+        Returns
+        -------
+        requests.Session
+        Session with timeouts, retries on transient errors and JSON content type
+        """
+        session = requests.Session()
+        # 429 is left to the retry logic of the callers, as it also reports permanent quota errors
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        adapter = TimeoutHTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        return session
+
+    def _get_aiosession(self):
+        """Lazily creates the aiohttp session used by the async calls. A session is bound to the
+        event loop it was created on, so a new one is created when called from another loop
+        (e.g. a later asyncio.run)"""
+        loop = asyncio.get_running_loop()
+        if self._aiosession is None or self._aioloop is not loop:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "Async calls require aiohttp. Install it using: pip install darwin-py[async]"
+                ) from None
+            connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, use_dns_cache=True)
+            self._aiosession = aiohttp.ClientSession(connector=connector, headers={"Content-Type": "application/json"})
+            self._aioloop = loop
+        return self._aiosession
+
     @staticmethod
     def _decode_response(response, debug: bool = False):
         """ Decode the response as JSON entry or return a dictionary with the error
@@ -502,7 +838,7 @@ class Client:
         JSON decoded entry or error
         """
         try:
-            return response.json()
+            return json_loads(response.content)
         except ValueError:
             if debug:
                 print(f"[ERROR {response.status_code}] {response.text}")
@@ -1,12 +1,59 @@
 import datetime
+import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import requests
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
 from darwin.dataset.identifier import DatasetIdentifier
 
+# Size of the buffer used to copy the release zip to disk
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# Number of byte ranges fetched concurrently when the server supports range requests
+DOWNLOAD_PARTS = 8
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    """Parses an ISO 8601 timestamp as returned by the API (e.g. 2020-01-01T10:00:00Z)"""
+    try:
+        # Before python 3.11 fromisoformat does not accept the trailing Z
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        pass
+    try:
+        return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        # For python version older than 3.7
+        return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+
+
+if parse_datetime is None:
+    parse_datetime = _parse_datetime
+
 
 class Release:
+    __slots__ = (
+        "dataset_slug",
+        "team_slug",
+        "version",
+        "name",
+        "url",
+        "export_date",
+        "image_count",
+        "class_count",
+        "available",
+        "latest",
+        "format",
+        "sha256",
+    )
+
     def __init__(
         self,
         dataset_slug,
@@ -32,14 +79,12 @@ class Release:
         self.available = available
         self.latest = latest
         self.format = format
+        # Hex SHA-256 digest of the zip, set by download_zip
+        self.sha256 = None
 
     @classmethod
     def parse_json(cls, dataset_slug, team_slug, payload):
-        try:
-            export_date = datetime.datetime.strptime(payload["inserted_at"], "%Y-%m-%dT%H:%M:%S%z")
-        except ValueError:
-            # For python version older than 3.7
-            export_date = datetime.datetime.strptime(payload["inserted_at"], "%Y-%m-%dT%H:%M:%SZ")
+        export_date = parse_datetime(payload["inserted_at"])
         if payload["download_url"] is None:
             return cls(
                 dataset_slug=dataset_slug,
@@ -69,12 +114,104 @@ class Release:
             format=payload.get("format", "json"),
         )
 
-    def download_zip(self, path):
-        with requests.get(self.url, stream=True) as r:
-            with open(str(path), "wb") as f:
-                shutil.copyfileobj(r.raw, f)
+    def download_zip(
+        self, path, session: Optional[requests.Session] = None, executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """Downloads the release zip and sets its SHA-256 digest on sha256
+
+        Parameters
+        ----------
+        path: Path
+            Where to write the zip
+        session: requests.Session
+            Session to download with, reusing its connections
+        executor: ThreadPoolExecutor
+            Pool downloading the byte ranges of large zips when the server supports range requests.
+            A temporary one is created if not given
+
+        Returns
+        -------
+        Path
+            The path of the downloaded zip
+        """
+        session = session or requests
+        size = self._ranged_download_size(session)
+        self.sha256 = None
+        if size is None:
+            self.sha256 = self._download_zip_stream(path, session)
+        elif executor is None:
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as executor:
+                self.sha256 = self._download_zip_parts(path, session, size, executor)
+        else:
+            self.sha256 = self._download_zip_parts(path, session, size, executor)
         return path
 
+    def _ranged_download_size(self, session) -> Optional[int]:
+        """Returns the size of the release zip if the server honours range requests and the zip
+        is large enough to be worth splitting, None otherwise"""
+        # Presigned URLs are only valid for GET, so probe with a single byte range instead of a HEAD
+        with session.get(self.url, headers={"Range": "bytes=0-0"}, stream=True) as r:
+            content_range = r.headers.get("Content-Range", "")
+            if r.status_code != 206 or not content_range.startswith("bytes "):
+                return None
+            total = content_range.rpartition("/")[2]
+        if not total.isdigit() or int(total) < DOWNLOAD_PARTS * DOWNLOAD_CHUNK_SIZE:
+            return None
+        return int(total)
+
+    def _download_zip_stream(self, path, session) -> str:
+        digest = hashlib.sha256()
+        with session.get(self.url, stream=True) as r:
+            # The zip is already compressed, store the bytes as they come from the wire
+            r.raw.decode_content = False
+            with open(str(path), "wb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # Hash while copying, so that the digest doesn't need another pass over the file
+                for chunk in iter(lambda: r.raw.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def _download_zip_parts(self, path, session, size: int, executor: ThreadPoolExecutor) -> str:
+        with open(str(path), "wb") as f:
+            f.truncate(size)
+
+        part_size = -(-size // DOWNLOAD_PARTS)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        def download_part(byte_range):
+            start, end = byte_range
+            with session.get(self.url, headers={"Range": f"bytes={start}-{end}"}, stream=True) as r:
+                if r.status_code != 206:
+                    raise ValueError(f"Unexpected status ({r.status_code}) downloading bytes {start}-{end}")
+                content_range = r.headers.get("Content-Range", "")
+                if content_range != f"bytes {start}-{end}/{size}":
+                    raise ValueError(f"Unexpected range ({content_range}) downloading bytes {start}-{end}")
+                r.raw.decode_content = False
+                # Each part writes through its own handle at its own offset of the pre-allocated file
+                with open(str(path), "r+b") as f:
+                    f.seek(start)
+                    shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    written = f.tell() - start
+            # A short part would leave a zero-filled hole in the pre-allocated file
+            if written != end - start + 1:
+                raise ValueError(f"Incomplete download of bytes {start}-{end} ({written} bytes received)")
+            return byte_range
+
+        # Parts are hashed in order as soon as they and the ones before them are written,
+        # reading them back from the page cache while the later parts are still downloading
+        digest = hashlib.sha256()
+        with open(str(path), "rb") as f:
+            for start, end in executor.map(download_part, ranges):
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining:
+                    chunk = f.read(min(remaining, DOWNLOAD_CHUNK_SIZE))
+                    digest.update(chunk)
+                    remaining -= len(chunk)
+        return digest.hexdigest()
+
     @property
     def identifier(self) -> DatasetIdentifier:
         return DatasetIdentifier(team_slug=self.team_slug, dataset_slug=self.dataset_slug, version=self.name)
@@ -219,7 +219,9 @@ class RemoteDataset:
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_dir = Path(tmp_dir)
             # Download the release from Darwin
-            zip_file_path = release.download_zip(tmp_dir / "dataset.zip")
+            zip_file_path = release.download_zip(
+                tmp_dir / "dataset.zip", session=self.client._session, executor=self.client.pool
+            )
             with zipfile.ZipFile(zip_file_path) as z:
                 # Extract annotations
                 z.extractall(tmp_dir)
@@ -1,14 +1,33 @@
+import importlib
 from functools import partial
 
-from . import coco, cvat, dataloop, instance_mask, pascalvoc, semantic_mask
-
-supported_formats = [
-    ("coco", coco.export),
-    ("cvat", cvat.export),
-    ("dataloop", dataloop.export),
-    ("instance-mask", instance_mask.export),
-    ("pascal_voc", pascalvoc.export),
-    ("semantic-mask", partial(semantic_mask.export, mode="rgb")),
-    ("semantic-mask-grey", partial(semantic_mask.export, mode="grey")),
-    ("semantic-mask-index", partial(semantic_mask.export, mode="index")),
-]
+# Format name -> (submodule, keyword arguments of its export function).
+# Submodules are only imported once their format is used, so that importing darwin
+# does not pull in the dependencies of every exporter.
+_FORMATS = {
+    "coco": ("coco", {}),
+    "cvat": ("cvat", {}),
+    "dataloop": ("dataloop", {}),
+    "instance-mask": ("instance_mask", {}),
+    "pascal_voc": ("pascalvoc", {}),
+    "semantic-mask": ("semantic_mask", {"mode": "rgb"}),
+    "semantic-mask-grey": ("semantic_mask", {"mode": "grey"}),
+    "semantic-mask-index": ("semantic_mask", {"mode": "index"}),
+}
+
+
+def get_exporter(name: str):
+    """Imports the module of the given format and returns its export function"""
+    module_name, kwargs = _FORMATS[name]
+    export = importlib.import_module(f"{__name__}.{module_name}").export
+    return partial(export, **kwargs) if kwargs else export
+
+
+def _lazy_exporter(name: str):
+    def export(*args, **kwargs):
+        return get_exporter(name)(*args, **kwargs)
+
+    return export
+
+
+supported_formats = [(name, _lazy_exporter(name)) for name in _FORMATS]
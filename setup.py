@@ -18,7 +18,9 @@ setuptools.setup(
         "docutils",
         "factory_boy",
         "humanize",
+        "ijson",
         "numpy",
+        "orjson",
         "pillow",
         "pyyaml>=5.1",
         "requests",
@@ -27,6 +29,7 @@ setuptools.setup(
         "tqdm",
         "upolygon==0.1.5",
     ],
+    extras_require={"async": ["aiohttp"], "brotli": ["brotli"]},
     packages=setuptools.find_packages(),
     entry_points={"console_scripts": ["darwin=darwin.cli:main"]},
     classifiers=["Programming Language :: Python :: 3", "License :: OSI Approved :: MIT License"],